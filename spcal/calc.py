@@ -40,12 +40,14 @@ def otsu(x: np.ndarray, remove_nan: bool = False, nbins: str | int = "fd") -> fl
     bin_centers = (bin_edges[1:] + bin_edges[:-1]) / 2.0
 
     w1 = np.cumsum(hist)
-    w2 = np.cumsum(hist[::-1])[::-1]
+    wc1 = np.cumsum(hist * bin_centers)
 
-    u1 = np.cumsum(hist * bin_centers) / w1
-    u2 = (np.cumsum((hist * bin_centers)[::-1]) / w2[::-1])[::-1]
+    # class 2 moments follow from the totals, avoiding the reversed cumsums
+    w2 = w1[-1] - w1[:-1]
+    u1 = wc1[:-1] / w1[:-1]
+    u2 = (wc1[-1] - wc1[:-1]) / w2
 
-    i = np.argmax(w1[:-1] * w2[1:] * (u1[:-1] - u2[1:]) ** 2)
+    i = np.argmax(w1[:-1] * w2 * (u1 - u2) ** 2)
     return bin_centers[i]
 
 
@@ -68,20 +70,24 @@ def pca(
         return (x - x.mean(axis=0)) / x.std(axis=0)
 
     x = standardise(x)
-    # evalues, evectors = np.linalg.eig(cov)
-    u, s, v = np.linalg.svd(x, full_matrices=False)
+    # eigendecomposition of the small features x features Gram matrix, much
+    # cheaper than a full SVD over the samples for the few components used
+    evalues, evectors = np.linalg.eigh(x.T @ x)
+    evalues, evectors = evalues[::-1], evectors[:, ::-1]  # eigh is ascending
+
+    a = x @ evectors  # scores, the svd's u * s
 
     # ensure determenistic, see scikit-learn's svd_flip
-    sign = np.sign(u[np.argmax(np.abs(u), axis=0), np.arange(u.shape[1])])
-    u *= sign
-    v *= sign[:, None]
+    sign = np.sign(a[np.argmax(np.abs(a), axis=0), np.arange(a.shape[1])])
+    sign[sign == 0.0] = 1.0
+    a *= sign
 
-    explained_variance = s**2 / x.shape[0]
+    explained_variance = np.maximum(evalues, 0.0) / x.shape[0]
     explained_variance = explained_variance / np.sum(explained_variance)
 
     return (
-        u[:, :trim_to_components] * s[:trim_to_components],
-        v[:trim_to_components],
+        a[:, :trim_to_components],
+        (evectors * sign).T[:trim_to_components],
         explained_variance[:trim_to_components],
     )
 
@@ -131,20 +137,21 @@ def weighted_rsq(x: np.ndarray, y: np.ndarray, w: np.ndarray | None = None) -> f
         y: array, same size as `x`
         w: weights, same size as `x`
     """
-    c = np.cov(x, y, aweights=w)
-    d = np.diag(c)
-
-    stddev = np.sqrt(d.real)
-    stddev[stddev == 0.0] = np.nan
-
-    c /= stddev[:, None]
-    c /= stddev[None, :]
-
-    np.clip(c.real, -1, 1, out=c.real)
-    if np.iscomplexobj(c):  # pragma: no cover
-        np.clip(c.imag, -1, 1, out=c.imag)
-
-    return c[0, 1] ** 2.0
+    # Direct weighted moments, the normalisation of np.cov cancels in the
+    # correlation so only the weighted products are needed
+    if w is None:
+        w = np.ones_like(x)
+    sw = np.sum(w)
+    dx = x - np.sum(w * x) / sw
+    dy = y - np.sum(w * y) / sw
+
+    sxy = np.sum(w * dx * dy)
+    sxx = np.sum(w * dx * dx)
+    syy = np.sum(w * dy * dy)
+
+    if sxx == 0.0 or syy == 0.0:
+        return np.nan
+    return min(sxy**2 / (sxx * syy), 1.0)
 
 
 def weighted_linreg(
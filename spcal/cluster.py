@@ -1,6 +1,7 @@
 """Agglomerative clustering."""
 
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 
 from spcal.lib.spcalext import cluster_by_distance, mst_linkage, pairwise_euclidean
 
@@ -17,13 +18,16 @@ def prepare_data_for_clustering(data: np.ndarray | dict[str, np.ndarray]) -> np.
     Returns:
         2D array, ready for ``agglomerative_cluster``
     """
-    names = list(data.dtype.names if isinstance(data, np.ndarray) else data.keys())
-
-    X = np.empty((len(data[names[0]]), len(names)), dtype=np.float64)
-    for i, name in enumerate(names):
-        X[:, i] = data[name]
-    totals = np.sum(X, axis=1)
-    np.divide(X.T, totals, where=totals > 0.0, out=X.T)
+    if isinstance(data, np.ndarray):  # structured array, a single copy
+        X = structured_to_unstructured(data, dtype=np.float64, copy=True)
+    else:
+        names = list(data.keys())
+        X = np.empty((len(data[names[0]]), len(names)), dtype=np.float64)
+        for i, name in enumerate(names):
+            X[:, i] = data[name]
+    # divide row-wise, writes are contiguous unlike the transposed view
+    totals = np.sum(X, axis=1, keepdims=True)
+    np.divide(X, totals, where=totals > 0.0, out=X)
     return X
 
 
@@ -49,15 +53,17 @@ def agglomerative_cluster(X: np.ndarray, max_dist: float) -> np.ndarray:
 
 
 def cluster_information(
-    X: np.ndarray, T: np.ndarray
+    X: np.ndarray, T: np.ndarray, max_clusters: int | None = None
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Get information about a clustering result.
 
-    Clusters are sorted by size, largest to smallest.
+    Clusters are sorted by size, largest to smallest. If ``max_clusters`` is
+    given only the largest ``max_clusters`` clusters are returned.
 
     Args:
         X: 2D array (samples, features)
         T: cluster indicies
+        max_clusters: limit to this many clusters
 
     Returns:
         cluster means
@@ -65,15 +71,28 @@ def cluster_information(
         cluster counts
     """
     counts = np.bincount(T)
-    means = np.empty((counts.size, X.shape[1]), dtype=np.float64)
-    stds = np.empty((counts.size, X.shape[1]), dtype=np.float64)
-
-    for i in range(means.shape[1]):
-        sx = np.bincount(T, weights=X[:, i])
-        sx2 = np.bincount(T, weights=X[:, i] ** 2)
-        means[:, i] = np.divide(sx, counts, where=counts >= 1.0)
-        var = np.divide(sx2, counts, where=counts >= 1.0) - means[:, i] ** 2
-        stds[:, i] = np.sqrt(np.where(var > 0.0, var, 0.0))
 
-    idx = np.argsort(counts)[::-1]
+    # fuse the per-feature bincounts into one pass using cluster * feature bins
+    num_features = X.shape[1]
+    bins = (T[:, None] * num_features + np.arange(num_features)).ravel()
+    sx = np.bincount(
+        bins, weights=X.ravel(), minlength=counts.size * num_features
+    ).reshape(counts.size, num_features)
+    sx2 = np.bincount(
+        bins, weights=np.square(X).ravel(), minlength=counts.size * num_features
+    ).reshape(counts.size, num_features)
+
+    valid = counts[:, None] >= 1
+    means = np.divide(sx, counts[:, None], out=np.zeros_like(sx), where=valid)
+    var = np.divide(
+        sx2, counts[:, None], out=np.zeros_like(sx2), where=valid
+    ) - np.square(means)
+    stds = np.sqrt(np.where(var > 0.0, var, 0.0))
+
+    if max_clusters is not None and max_clusters < counts.size:
+        # partition to the top clusters then sort only those
+        idx = np.argpartition(counts, counts.size - max_clusters)[-max_clusters:]
+        idx = idx[np.argsort(counts[idx])[::-1]]
+    else:
+        idx = np.argsort(counts)[::-1]
     return means[idx], stds[idx], counts[idx]
@@ -2,6 +2,7 @@
 
 import numpy as np
 
+from spcal.lib import spcalext
 from spcal.lib.spcalext import maxima
 
 
@@ -17,15 +18,11 @@ def _contiguous_regions(x: np.ndarray, limit: float | np.ndarray) -> np.ndarray:
         regions [start, end]
     """
 
-    # Get start and end positions of regions above accumulation limit
-    diff = np.diff((x > limit).astype(np.int8), prepend=0)
-    starts = np.flatnonzero(diff == 1)
-    ends = np.flatnonzero(diff == -1)
-    # Stack into pairs of start, end. If no final end position set it as end of array.
-    if starts.size != ends.size:
-        # -1 for reduceat
-        ends = np.concatenate((ends, [diff.size]))  # type: ignore
-    return np.stack((starts, ends), axis=1)
+    # Single scan over x, the numpy version needed a mask, diff and two
+    # flatnonzero passes. A region open at the end of the array ends at x.size.
+    return spcalext.contiguous_regions(
+        x, np.atleast_1d(np.asarray(limit, dtype=np.float64))
+    )
 
 
 def _label_regions(regions: np.ndarray, size: int) -> np.ndarray:
@@ -38,20 +35,8 @@ def _label_regions(regions: np.ndarray, size: int) -> np.ndarray:
     Returns:
         labeled regions
     """
-    labels = np.zeros(size, dtype=np.int16)
-    if regions.size == 0:
-        return labels
-
-    ix = np.arange(1, regions.shape[0] + 1)
-
-    starts, ends = regions[:, 0], regions[:, 1]
-    ends = ends[ends < size]
-    # Set start, end pairs to +i, -i.
-    labels[starts] = ix
-    labels[ends] = -ix[: ends.size]  # possible over end
-    # Cumsum to label
-    labels = np.cumsum(labels)
-    return labels
+    # Regions are sparse so written directly, avoiding a cumsum over the array
+    return spcalext.label_regions(regions, size)
 
 
 def accumulate_detections(
@@ -79,34 +64,18 @@ def accumulate_detections(
         labels of regions
         regions [starts, ends]
     """
-    if np.any(limit_accumulation > limit_detection):
-        raise ValueError("accumulate_detections: limit_accumulation > limit_detection.")
     if points_required < 1:
         raise ValueError("accumulate_detections: minimum size must be >= 1")
 
-    regions = _contiguous_regions(y, limit_accumulation)
-    indicies = regions.ravel()
-    if indicies.size > 0 and indicies[-1] == y.size:
-        indicies = indicies[:-1]
-
-    # Get maximum in each region
-    detections = np.add.reduceat(y > limit_detection, indicies)[::2]
-    # Remove regions without minimum_size values above detection limit
-    regions = regions[detections >= points_required]
-
-    indicies = regions.ravel()
-    if indicies.size > 0 and indicies[-1] == y.size:
-        indicies = indicies[:-1]
-
-    # Sum regions
-    if integrate:
-        sums = np.add.reduceat(y - limit_accumulation, indicies)[::2]
-    else:
-        sums = np.add.reduceat(y, indicies)[::2]
-
-    # Create a label array of detections
-    labels = _label_regions(regions, y.size)
-
+    # Single pass scan over y, summing, labeling and locating regions at once.
+    # Also raises if any limit_accumulation > limit_detection.
+    sums, labels, regions = spcalext.accumulate_detections(
+        y,
+        np.atleast_1d(np.asarray(limit_accumulation, dtype=np.float64)),
+        np.atleast_1d(np.asarray(limit_detection, dtype=np.float64)),
+        points_required,
+        integrate,
+    )
     return sums, labels, regions
 
 
@@ -140,20 +109,24 @@ def combine_detections(
 
     # Get regions from all elements
     # Some regions may overlap, these will be combined
-    any_label = np.zeros(labels[names[0]].size, dtype=np.int8)
-    for name in names:
-        any_label[labels[name] > 0] = 1
+    any_label = labels[names[0]] > 0
+    for name in names[1:]:
+        np.logical_or(any_label, labels[name] > 0, out=any_label)
 
     all_regions = _contiguous_regions(any_label, 0)
     any_label = _label_regions(all_regions, any_label.size)
 
-    # Init to zero, summed later
-    combined = np.zeros(
+    combined = np.empty(
         all_regions.shape[0], dtype=[(name, np.float64) for name in sums]
     )
+    # contiguous copy once, searchsorted copies strided columns internally
+    all_starts = np.ascontiguousarray(all_regions[:, 0])
     for name in names:
-        idx = np.searchsorted(all_regions[:, 0], regions[name][:, 0], side="right") - 1
-        np.add.at(combined[name], idx, sums[name])
+        idx = np.searchsorted(all_starts, regions[name][:, 0], side="right") - 1
+        # bincount accumulates in one pass, much faster than np.add.at
+        combined[name] = np.bincount(
+            idx, weights=sums[name], minlength=all_regions.shape[0]
+        )
 
     return combined, any_label, all_regions
 
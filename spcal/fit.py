@@ -5,20 +5,20 @@ from typing import Callable
 import numpy as np
 
 
+_inv_sqrt_2pi = 1.0 / np.sqrt(2.0 * np.pi)
+
+
 def normal_pdf(x: np.ndarray, mu: float, sigma: float) -> np.ndarray:
     """Probabilty density function of a normal distribution."""
-    return 1.0 / (sigma * np.sqrt(2.0 * np.pi)) * np.exp(-0.5 * ((x - mu) / sigma) ** 2)
+    z = (x - mu) * (1.0 / sigma)
+    return _inv_sqrt_2pi / sigma * np.exp(-0.5 * z * z)
 
 
 def lognormal_pdf(x: np.ndarray, mu: float, sigma: float) -> np.ndarray:
     """Probabilty density function of a log-normal distribution."""
     with np.errstate(invalid="ignore"):
-        logx = np.log(x)
-    return (
-        1.0
-        / (x * sigma * np.sqrt(2.0 * np.pi))
-        * np.exp(-0.5 * ((logx - mu) / sigma) ** 2)
-    )
+        z = (np.log(x) - mu) * (1.0 / sigma)
+    return _inv_sqrt_2pi / sigma / x * np.exp(-0.5 * z * z)
 
 
 def nelder_mead(
@@ -133,9 +133,13 @@ def fit_normal(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
         return np.sum(np.square(y - normal_pdf(x * scale, mu, sigma)))
 
     assert x.size == y.size
-    # Guess for result
-    mu = np.mean(x)
-    s = np.std(x)
+    # Guess using density weighted moments, the closed-form MLE for a normal
+    sw = np.sum(y)
+    if sw > 0.0:
+        mu = np.sum(x * y) / sw
+        s = np.sqrt(np.sum(y * np.square(x - mu)) / sw)
+    if sw <= 0.0 or not (np.isfinite(mu) and s > 0.0):  # pragma: no cover
+        mu, s = np.mean(x), np.std(x)
     simplex = np.array(
         [[mu, s, 1.0], [np.max(x), s, 1.0], [mu, 10.0, 1.0], [mu, s, 10.0]]
     )
@@ -164,9 +168,15 @@ def fit_lognormal(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
         return np.sum(np.square(y - lognormal_pdf(xl, mu, sigma)))
 
     assert x.size == y.size
-    # Guess for result
-    mu = np.log(np.median(x))
-    s = 0.1
+    # Guess using moments of log(x), the closed-form MLE for a log-normal
+    valid = x > 0.0
+    sw = np.sum(y[valid])
+    if sw > 0.0:
+        logx = np.log(x[valid])
+        mu = np.sum(y[valid] * logx) / sw
+        s = np.sqrt(np.sum(y[valid] * np.square(logx - mu)) / sw)
+    if sw <= 0.0 or not (np.isfinite(mu) and s > 0.0):  # pragma: no cover
+        mu, s = np.log(np.median(x)), 0.1
     simplex = np.array(
         [
             [mu, s, 0.0],
@@ -1,6 +1,7 @@
 import json
 import logging
 import re
+from itertools import islice
 from pathlib import Path
 from types import TracebackType
 
@@ -26,6 +27,24 @@ from spcal.siunits import time_units
 
 logger = logging.getLogger(__name__)
 
+# map combo labels to delimiters, other labels are the delimiter itself
+_delimiters = {"Space": " ", "Tab": "\t"}
+
+# TOFWERK peak labels like '[107Ag]+', compiled once for every dialog
+_re_isotope_label = re.compile("\\[(\\d+)([A-Z][a-z]?)\\]\\+")
+
+
+def count_lines_in_file(path: Path) -> int:
+    """Number of newlines in a file.
+
+    Reads in 4 MiB chunks so libc does the counting, not a Python loop.
+    """
+    with path.open("rb") as fp:
+        line_count = 0
+        while chunk := fp.read(4 * 1024 * 1024):
+            line_count += chunk.count(b"\n")
+    return line_count
+
 
 class _ImportDialogBase(QtWidgets.QDialog):
     dataImported = QtCore.Signal(np.ndarray, dict)
@@ -175,9 +194,8 @@ class TextImportDialog(_ImportDialogBase):
 
         header_row_count = 10
 
-        self.file_header = [
-            x for _, x in zip(range(header_row_count), self.file_path.open("r"))
-        ]
+        with self.file_path.open("r") as fp:
+            self.file_header = list(islice(fp, header_row_count))
 
         # Guess the delimiter, skip rows and count from header
         first_data_line = 0
@@ -186,19 +204,21 @@ class TextImportDialog(_ImportDialogBase):
         for line in self.file_header:
             try:
                 delimiter = next(d for d in ["\t", ";", ",", " "] if d in line)
-                float(line.split(delimiter)[-1])
+                # only the last field is tested, no need to split the line
+                float(line.rsplit(delimiter, 1)[-1])
                 break
             except (ValueError, StopIteration):
                 pass
             first_data_line += 1
 
-        column_count = max([line.count(delimiter) for line in self.file_header]) + 1
+        column_count = max(line.count(delimiter) for line in self.file_header) + 1
 
-        with self.file_path.open("rb") as fp:
-            line_count = 0
-            buffer = bytearray(4086)
-            while fp.readinto(buffer):
-                line_count += buffer.count(b"\n")
+        # count in the background so a large file does not block the dialog
+        self.label_line_count = QtWidgets.QLabel("...")
+        worker = Worker(count_lines_in_file, self.file_path)
+        worker.setAutoDelete(True)
+        worker.signals.result.connect(self.setLineCount)
+        QtCore.QThreadPool.globalInstance().start(worker)
 
         self.table = QtWidgets.QTableWidget()
         self.table.itemChanged.connect(self.completeChanged)
@@ -207,7 +227,7 @@ class TextImportDialog(_ImportDialogBase):
         self.table.setRowCount(header_row_count)
         self.table.setFont(QtGui.QFont("Courier"))
 
-        self.box_info.layout().addRow("Line Count:", QtWidgets.QLabel(str(line_count)))
+        self.box_info.layout().addRow("Line Count:", self.label_line_count)
 
         self.combo_intensity_units = QtWidgets.QComboBox()
         self.combo_intensity_units.addItems(["Counts", "CPS"])
@@ -229,6 +249,10 @@ class TextImportDialog(_ImportDialogBase):
             QtGui.QRegularExpressionValidator(QtCore.QRegularExpression("[0-9;]+"))
         )
         self.le_ignore_columns.textChanged.connect(self.updateTableIgnores)
+        # last parsed ignore columns, as (text, columns)
+        self._ignore_columns_cache: tuple[str, list[int]] = ("", [])
+        # last full file parse, as (import options key, data)
+        self._parse_cache: tuple[tuple, np.ndarray] | None = None
 
         self.box_options.layout().addRow("Intensity Units:", self.combo_intensity_units)
         self.box_options.layout().addRow("Delimiter:", self.combo_delimiter)
@@ -250,21 +274,24 @@ class TextImportDialog(_ImportDialogBase):
             x in self.forbidden_names for x in self.names()
         )
 
+    def setLineCount(self, line_count: int) -> None:
+        self.label_line_count.setText(str(line_count))
+
     def delimiter(self) -> str:
         delimiter = self.combo_delimiter.currentText()
-        if delimiter == "Space":
-            delimiter = " "
-        elif delimiter == "Tab":
-            delimiter = "\t"
-        return delimiter
+        return _delimiters.get(delimiter, delimiter)
 
     def ignoreColumns(self) -> list[int]:
-        return [int(i) - 1 for i in self.le_ignore_columns.text().split(";") if i != ""]
+        # called several times per keystroke, only re-parse on a change
+        text = self.le_ignore_columns.text()
+        if text != self._ignore_columns_cache[0]:
+            columns = [int(i) - 1 for i in text.split(";") if i != ""]
+            self._ignore_columns_cache = (text, columns)
+        return self._ignore_columns_cache[1]
 
     def useColumns(self) -> list[int]:
-        return [
-            c for c in range(self.table.columnCount()) if c not in self.ignoreColumns()
-        ]
+        ignores = set(self.ignoreColumns())
+        return [c for c in range(self.table.columnCount()) if c not in ignores]
 
     def names(self) -> list[str]:
         names = []
@@ -277,13 +304,25 @@ class TextImportDialog(_ImportDialogBase):
     def fillTable(self) -> None:
         lines = [line.split(self.delimiter()) for line in self.file_header]
         col_count = max(len(line) for line in lines)
-        self.table.setColumnCount(col_count)
+        if self.table.columnCount() != col_count:
+            self.table.setColumnCount(col_count)
 
-        for row, line in enumerate(lines):
-            line.extend([""] * (col_count - len(line)))
-            for col, text in enumerate(line):
-                item = QtWidgets.QTableWidgetItem(text.strip().replace(" ", "_"))
-                self.table.setItem(row, col, item)
+        # block itemChanged -> completeChanged and repaints during the fill
+        self.table.setUpdatesEnabled(False)
+        blocked = self.table.blockSignals(True)
+        try:
+            for row, line in enumerate(lines):
+                line.extend([""] * (col_count - len(line)))
+                for col, text in enumerate(line):
+                    text = text.strip().replace(" ", "_")
+                    item = self.table.item(row, col)
+                    if item is None:
+                        self.table.setItem(row, col, QtWidgets.QTableWidgetItem(text))
+                    else:  # reuse existing items on delimiter changes
+                        item.setText(text)
+        finally:
+            self.table.blockSignals(blocked)
+            self.table.setUpdatesEnabled(True)
 
         self.table.resizeColumnsToContents()
         self.updateTableIgnores()
@@ -294,19 +333,32 @@ class TextImportDialog(_ImportDialogBase):
 
     def updateTableIgnores(self) -> None:
         header_row = self.spinbox_first_line.value() - 1
-        for row in range(self.table.rowCount()):
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item is None:
-                    continue
-                if row != header_row:
-                    item.setFlags(item.flags() & ~QtCore.Qt.ItemIsEditable)
-                else:
-                    item.setFlags(item.flags() | QtCore.Qt.ItemIsEditable)
-                if row < header_row or col in self.ignoreColumns():
-                    item.setFlags(item.flags() & ~QtCore.Qt.ItemIsEnabled)
-                else:
-                    item.setFlags(item.flags() | QtCore.Qt.ItemIsEnabled)
+        ignores = set(self.ignoreColumns())  # parse once, not per cell
+        editable = QtCore.Qt.ItemIsEditable
+        enabled = QtCore.Qt.ItemIsEnabled
+        # setFlags emits itemChanged, coalesce into one completeChanged
+        blocked = self.table.blockSignals(True)
+        try:
+            for row in range(self.table.rowCount()):
+                for col in range(self.table.columnCount()):
+                    item = self.table.item(row, col)
+                    if item is None:
+                        continue
+                    # compute flags then set once, each call crosses the bindings
+                    flags = item.flags()
+                    if row == header_row:
+                        new_flags = flags | editable
+                    else:
+                        new_flags = flags & ~editable
+                    if row < header_row or col in ignores:
+                        new_flags &= ~enabled
+                    else:
+                        new_flags |= enabled
+                    if new_flags != flags:
+                        item.setFlags(new_flags)
+        finally:
+            self.table.blockSignals(blocked)
+        self.completeChanged()
 
     def guessIgnoreColumnsFromTable(self) -> None:
         ignores = []
@@ -318,16 +370,24 @@ class TextImportDialog(_ImportDialogBase):
         self.le_ignore_columns.setText(";".join(str(x) for x in ignores) + ";")
 
     def guessDwelltimeFromTable(self) -> None:
+        # read from the cached header lines, each table item is a Qt call
+        lines = [line.split(self.delimiter()) for line in self.file_header]
         header_row = self.spinbox_first_line.value() - 1
-        for col in range(self.table.columnCount()):
-            text = self.table.item(header_row, col).text().lower()
+        for col, text in enumerate(lines[header_row]):
+            text = text.lower()
             if "time" in text:
                 try:
-                    times = [
-                        float(self.table.item(row, col).text().replace(",", "."))
-                        for row in range(header_row + 1, self.table.rowCount())
-                    ]
-                except ValueError:
+                    # numpy parses the strings in one C call
+                    times = np.array(
+                        [
+                            line[col].replace(",", ".")
+                            for line in lines[header_row + 1 :]
+                        ],
+                        dtype=np.float64,
+                    )
+                except (ValueError, IndexError):
+                    continue
+                if times.size < 2:
                     continue
                 if "ms" in text:
                     factor = 1e-3
@@ -335,9 +395,9 @@ class TextImportDialog(_ImportDialogBase):
                     factor = 1e-6
                 else:  # assume that value is in seconds
                     factor = 1.0
-                self.dwelltime.setBaseValue(
-                    np.round(np.mean(np.diff(times)) * factor, 6)  # type: ignore
-                )
+                # the mean difference of evenly spaced times is the end point slope
+                dwell = (times[-1] - times[0]) / (len(times) - 1)
+                self.dwelltime.setBaseValue(np.round(dwell * factor, 6))
                 break
 
     def importOptions(self) -> dict:
@@ -386,19 +446,40 @@ class TextImportDialog(_ImportDialogBase):
                     item.setText(name)
         self.combo_intensity_units.setCurrentText("CPS" if options["cps"] else "Counts")
 
-    def dataForScreening(self, size: int) -> np.ndarray:
-        options = self.importOptions()
-        data, _ = read_single_particle_file(
+    def readData(self, options: dict, max_rows: int | None = None) -> np.ndarray:
+        """Read the file with the given import options.
+
+        Full file parses are cached so that accepting after a screening pass
+        that exhausted the file does not read it a second time.
+        """
+        key = (
+            options["path"],
+            options["delimiter"],
+            tuple(options["columns"]),
+            options["first line"],
+            options["dwelltime"] if options["cps"] else None,
+        )
+        if self._parse_cache is not None and self._parse_cache[0] == key:
+            return self._parse_cache[1][:max_rows]
+
+        data = read_single_particle_file(
             options["path"],
             delimiter=options["delimiter"],
             columns=options["columns"],
             first_line=options["first line"],
             convert_cps=options["dwelltime"] if options["cps"] else None,
-            max_rows=size,
+            max_rows=max_rows,
         )
-        data = rfn.structured_to_unstructured(data)
+        # a read shorter than requested covered the whole file
+        if max_rows is None or data.size < max_rows:
+            self._parse_cache = (key, data)
         return data
 
+    def dataForScreening(self, size: int) -> np.ndarray:
+        data = self.readData(self.importOptions(), max_rows=size)
+        # every field is float32 so this is a reinterpret, not a copy
+        return data.view(np.float32).reshape(data.size, len(data.dtype.names))
+
     def screenData(self, idx: np.ndarray, ppm: np.ndarray) -> None:
         options = self.importOptions()
 
@@ -410,13 +491,7 @@ class TextImportDialog(_ImportDialogBase):
     def accept(self) -> None:
         options = self.importOptions()
 
-        data = read_single_particle_file(
-            options["path"],
-            delimiter=options["delimiter"],
-            columns=options["columns"],
-            first_line=options["first line"],
-            convert_cps=options["dwelltime"] if options["cps"] else None,
-        )
+        data = self.readData(options)
         assert data.dtype.names is not None
         new_names = self.names()
         options["names"] = {old: new for old, new in zip(data.dtype.names, new_names)}
@@ -436,6 +511,8 @@ class NuImportDialog(_ImportDialogBase):
         self.running = False
 
         self.threadpool = QtCore.QThreadPool()
+        # more workers than this just contend for the same disk
+        self.threadpool.setMaxThreadCount(min(8, QtCore.QThread.idealThreadCount()))
         self.results: list[np.ndarray] = []
 
         with self.file_path.joinpath("run.info").open("r") as fp:
@@ -613,10 +690,15 @@ class NuImportDialog(_ImportDialogBase):
             data = nu.read_nu_integ_binary(
                 path, idx["FirstCycNum"], idx["FirstSegNum"], idx["FirstAcqNum"]
             )
+            # fuse the cycle and segment filters into a single copy
+            mask = None
             if cyc_number is not None:
-                data = data[data["cyc_number"] == cyc_number]
+                mask = data["cyc_number"] == cyc_number
             if seg_number is not None:
-                data = data[data["seg_number"] == seg_number]
+                seg_mask = data["seg_number"] == seg_number
+                mask = seg_mask if mask is None else mask & seg_mask
+            if mask is not None:
+                data = data[mask]
             return data
 
         self.setControlsEnabled(False)
@@ -717,7 +799,7 @@ class NuImportDialog(_ImportDialogBase):
 
 class TofwerkIntegrationThread(QtCore.QThread):
     integrationStarted = QtCore.Signal(int)
-    sampleIntegrated = QtCore.Signal()
+    samplesIntegrated = QtCore.Signal(int)
     integrationComplete = QtCore.Signal(np.ndarray)
 
     def __init__(
@@ -737,13 +819,23 @@ class TofwerkIntegrationThread(QtCore.QThread):
         if mode in [2, 5]:
             ps.append(h5["FullSpectra"].attrs["MassCalibration p3"][0])
 
-        lower = calibrate_mass_to_index(
-            peak_table["lower integration limit"][idx], mode, ps
-        )
-        upper = calibrate_mass_to_index(
-            peak_table["upper integration limit"][idx], mode, ps
+        # calibrate both limits in one call
+        limits = calibrate_mass_to_index(
+            np.concatenate(
+                (
+                    peak_table["lower integration limit"][idx],
+                    peak_table["upper integration limit"][idx],
+                )
+            ),
+            mode,
+            ps,
         )
+        lower, upper = limits[: len(idx)], limits[len(idx) :]
         self.indicies = np.stack((lower, upper + 1), axis=1)
+        # contiguous index array for reduceat, .flat re-materialises per call
+        self.flat_indicies = np.ascontiguousarray(
+            self.indicies.reshape(-1), dtype=np.intp
+        )
         self.scale_factor = float(
             (
                 h5["FullSpectra"].attrs["SampleInterval"][0] * 1e9
@@ -760,11 +852,20 @@ class TofwerkIntegrationThread(QtCore.QThread):
             dtype=np.float32,
         )
         self.integrationStarted.emit(data.shape[0])
-        for i, sample in enumerate(self.tof_data):
+        # read in ~8 MiB batches, one HDF5 read and reduceat per block
+        sample_nbytes = self.tof_data.dtype.itemsize * int(
+            np.prod(self.tof_data.shape[1:])
+        )
+        batch_size = max(1, (8 * 1024 * 1024) // sample_nbytes)
+        for start in range(0, data.shape[0], batch_size):
             if self.isInterruptionRequested():
                 return
-            data[i] = np.add.reduceat(sample, self.indicies.flat, axis=-1)[..., ::2]
-            self.sampleIntegrated.emit()
+            end = min(start + batch_size, data.shape[0])
+            block = self.tof_data[start:end]
+            data[start:end] = np.add.reduceat(block, self.flat_indicies, axis=-1)[
+                ..., ::2
+            ]
+            self.samplesIntegrated.emit(end)
         data *= self.scale_factor
         self.integrationComplete.emit(data)
 
@@ -778,27 +879,37 @@ class TofwerkImportDialog(_ImportDialogBase):
         self.progress = QtWidgets.QProgressBar()
 
         # Get the masses from the file
-        self.h5 = h5py.File(self.file_path, "r")
+        # a large chunk cache for the sequential TofData reads on integration,
+        # the default 1 MiB evicts partially read chunks
+        self.h5 = h5py.File(
+            self.file_path,
+            "r",
+            rdcc_nbytes=256 * 1024 * 1024,
+            rdcc_nslots=1000003,
+            rdcc_w0=0.0,
+        )
         self.peak_labels = self.h5["PeakData"]["PeakTable"]["label"].astype("U256")
         self.selected_idx = np.array([])
 
-        re_valid = re.compile("\\[(\\d+)([A-Z][a-z]?)\\]\\+")
-
-        isotopes = []
+        # map (isotope, symbol) to their database row, a scan per label is slow
+        isotope_rows = {
+            (isotope, symbol): i
+            for i, (isotope, symbol) in enumerate(
+                zip(db["isotopes"]["Isotope"].tolist(), db["isotopes"]["Symbol"].tolist())
+            )
+        }
+        rows = []
         other_peaks = []
         for label in self.peak_labels:
-            m = re_valid.match(label)
+            m = _re_isotope_label.match(label)
             if m is not None:
-                isotopes.append(
-                    db["isotopes"][
-                        (db["isotopes"]["Isotope"] == int(m.group(1)))
-                        & (db["isotopes"]["Symbol"] == m.group(2))
-                    ]
-                )
+                row = isotope_rows.get((int(m.group(1)), m.group(2)))
+                if row is not None:
+                    rows.append(row)
             else:
                 other_peaks.append(label)
 
-        self.table = PeriodicTableSelector(enabled_isotopes=np.array(isotopes))
+        self.table = PeriodicTableSelector(enabled_isotopes=db["isotopes"][rows])
         self.table.isotopesChanged.connect(self.completeChanged)
 
         self.combo_other_peaks = CheckableComboBox()
@@ -885,9 +996,8 @@ class TofwerkImportDialog(_ImportDialogBase):
 
     def screenData(self, idx: np.ndarray, ppm: np.ndarray) -> None:
         _isotopes, _ppm = [], []
-        re_valid = re.compile("\\[(\\d+)([A-Z][a-z]?)\\]\\+")
         for label, val in zip(self.peak_labels[idx], ppm):
-            m = re_valid.match(label)
+            m = _re_isotope_label.match(label)
             if m is not None:
                 _isotopes.append(
                     db["isotopes"][
@@ -939,9 +1049,7 @@ class TofwerkImportDialog(_ImportDialogBase):
                 self.h5, self.selected_idx, parent=self
             )
             self.thread.integrationStarted.connect(self.progress.setMaximum)
-            self.thread.sampleIntegrated.connect(
-                lambda: self.progress.setValue(self.progress.value() + 1)
-            )
+            self.thread.samplesIntegrated.connect(self.progress.setValue)
             self.thread.integrationComplete.connect(self.finalise)
             self.thread.start()
             # Peaks do not exist, we must integrate ourselves.
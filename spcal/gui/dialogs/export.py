@@ -107,19 +107,13 @@ class ExportDialog(QtWidgets.QDialog):
         dlg.open()
 
     def accept(self) -> None:
+        mass = self.mass_units.currentText()
+        size = self.size_units.currentText()
+        conc = self.conc_units.currentText()
         units = {
-            "mass": (
-                self.mass_units.currentText(),
-                mass_units[self.mass_units.currentText()],
-            ),
-            "size": (
-                self.size_units.currentText(),
-                size_units[self.size_units.currentText()],
-            ),
-            "conc": (
-                self.conc_units.currentText(),
-                molar_concentration_units[self.conc_units.currentText()],
-            ),
+            "mass": (mass, mass_units[mass]),
+            "size": (size, size_units[size]),
+            "conc": (conc, molar_concentration_units[conc]),
         }
 
         path = Path(self.lineedit_path.text())
@@ -5,6 +5,12 @@ from spcal.gui.widgets import UnitsWidget
 from spcal.result import ClusterFilter, Filter
 from spcal.siunits import mass_units, signal_units, size_units
 
+_filter_units = {
+    "Intensity": signal_units,
+    "Mass": mass_units,
+    "Size": size_units,
+}
+
 
 class FilterItemWidget(QtWidgets.QWidget):
     closeRequested = QtCore.Signal(QtWidgets.QWidget)
@@ -90,17 +96,11 @@ class FilterItemWidget(QtWidgets.QWidget):
         super().close()
 
     def changeUnits(self, unit: str) -> None:
-        if unit == "Intensity":
-            units = signal_units
-        elif unit == "Mass":
-            units = mass_units
-        elif unit == "Size":
-            units = size_units
-        else:
+        try:
+            self.value.setUnits(_filter_units[unit])
+        except KeyError:
             raise ValueError("changeUnits: unknown unit")
 
-        self.value.setUnits(units)
-
 
 class ClusterFilterItemWidget(QtWidgets.QWidget):
     closeRequested = QtCore.Signal(QtWidgets.QWidget)
@@ -352,8 +352,10 @@ class FilterDialog(QtWidgets.QDialog):
         for i in range(self.list.count()):
             widget = self.list.itemWidget(self.list.item(i))
             if isinstance(widget, FilterItemWidget):
-                if widget.value.baseValue() is not None:
-                    group.append(widget.asFilter())
+                # build once, ``asFilter`` re-reads every combo / value widget
+                filter = widget.asFilter()
+                if filter.value is not None:
+                    group.append(filter)
             elif isinstance(widget, BooleanItemWidget):
                 if len(group) > 0:
                     filters.append(group)
@@ -84,6 +84,8 @@ class HistogramOptionsDialog(QtWidgets.QDialog):
             format=sf,
         )
 
+        # only re-read the widths on apply if one has been edited
+        self._widths_dirty = False
         for widget in [
             self.width_signal,
             self.width_mass,
@@ -93,6 +95,7 @@ class HistogramOptionsDialog(QtWidgets.QDialog):
         ]:
             widget.setBestUnit()
             widget.lineedit.setPlaceholderText("auto")
+            widget.baseValueChanged.connect(self.setWidthsDirty)
 
         self.spinbox_percentile = QtWidgets.QSpinBox()
         self.spinbox_percentile.setMaximum(100)
@@ -151,6 +154,9 @@ class HistogramOptionsDialog(QtWidgets.QDialog):
         else:
             self.reject()
 
+    def setWidthsDirty(self) -> None:
+        self._widths_dirty = True
+
     def apply(self) -> None:
         if self.radio_fit_off.isChecked():
             fit = None
@@ -159,14 +165,6 @@ class HistogramOptionsDialog(QtWidgets.QDialog):
         else:
             fit = "log normal"
 
-        bin_widths = {
-            "signal": self.width_signal.baseValue(),
-            "mass": self.width_mass.baseValue(),
-            "size": self.width_size.baseValue(),
-            "volume": self.width_volume.baseValue(),
-            "cell_concentration": self.width_conc.baseValue(),
-        }
-
         percentile = self.spinbox_percentile.value()
 
         draw_filtered = self.check_draw_filtered.isChecked()
@@ -175,9 +173,18 @@ class HistogramOptionsDialog(QtWidgets.QDialog):
         if fit != self.fit:
             self.fit = fit
             self.fitChanged.emit(fit)
-        if bin_widths != self.bin_widths:
-            self.bin_widths = bin_widths
-            self.binWidthsChanged.emit(bin_widths)
+        if self._widths_dirty:
+            bin_widths = {
+                "signal": self.width_signal.baseValue(),
+                "mass": self.width_mass.baseValue(),
+                "size": self.width_size.baseValue(),
+                "volume": self.width_volume.baseValue(),
+                "cell_concentration": self.width_conc.baseValue(),
+            }
+            self._widths_dirty = False
+            if bin_widths != self.bin_widths:
+                self.bin_widths = bin_widths
+                self.binWidthsChanged.emit(bin_widths)
         if percentile != self.percentile:
             self.percentile = percentile
             self.percentileChanged.emit(percentile)
@@ -275,7 +282,7 @@ class CompositionsOptionsDialog(QtWidgets.QDialog):
             self.distance = distance
             self.distanceChanged.emit(distance)
         if size != self.minimum_size:
-            self.minimum_size == size
+            self.minimum_size = size
             self.minimumSizeChanged.emit(str(size))
         if mode != self.mode:
             self.modeChanged.emit(mode)
@@ -1,4 +1,5 @@
-from typing import Generator
+import math
+from functools import cache, lru_cache
 
 import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -7,6 +8,35 @@ from spcal.gui.models import NumpyRecArrayTableModel, SearchColumnsProxyModel
 from spcal.gui.widgets import ValidColorLineEdit
 from spcal.npdb import db
 
+# molecular weight of each symbol in the element database, saves a scan
+# and an array access per lookup
+_mw_for_symbol = dict(
+    zip(db["elements"]["Symbol"].tolist(), db["elements"]["MW"].tolist())
+)
+
+# compiled once, shared by the validator and formula parser
+_formula_regex = QtCore.QRegularExpression("([A-Z][a-z]?)([0-9\\.]*)")
+_formula_regex.optimize()
+
+_ratio_row_format = "{}{:<2}&nbsp;{:.4f}&nbsp;&nbsp;{}{}".format
+
+
+@lru_cache(maxsize=256)
+def _parse_formula(formula: str) -> tuple[tuple[tuple[str, float], ...], float]:
+    """Mass of each valid element in a formula and the total molecular weight.
+
+    Cached so that edits replaying a previous formula skip the parse.
+    """
+    masses: dict[str, float] = {}
+    iter = _formula_regex.globalMatch(formula)
+    while iter.hasNext():
+        match = iter.next()
+        mw = _mw_for_symbol.get(match.captured(1))
+        if mw is not None:
+            mass = mw * float(match.captured(2) or 1.0)
+            masses[match.captured(1)] = masses.get(match.captured(1), 0.0) + mass
+    return tuple(masses.items()), math.fsum(masses.values())
+
 
 class FormulaValidator(QtGui.QValidator):
     def __init__(
@@ -25,7 +55,7 @@ class FormulaValidator(QtGui.QValidator):
             return QtGui.QValidator.Intermediate
         while iter.hasNext():
             match = iter.next()
-            if match.captured(1) not in db["elements"]["Symbol"]:
+            if match.captured(1) not in _mw_for_symbol:
                 return QtGui.QValidator.Intermediate
         return QtGui.QValidator.Acceptable
 
@@ -40,13 +70,13 @@ class MassFractionCalculatorDialog(QtWidgets.QDialog):
         self.setWindowTitle("Mass Fraction Calculator")
         self.resize(300, 120)
 
-        self.regex = QtCore.QRegularExpression("([A-Z][a-z]?)([0-9\\.]*)")
         self.ratios: dict[str, float] = {}
         self.mw = 0.0
+        self._last_ratio_html = ""
 
         self.lineedit_formula = ValidColorLineEdit(formula)
         self.lineedit_formula.setPlaceholderText("Molecular Formula")
-        self.lineedit_formula.setValidator(FormulaValidator(self.regex))
+        self.lineedit_formula.setValidator(FormulaValidator(_formula_regex))
         self.lineedit_formula.textChanged.connect(self.recalculate)
 
         self.label_mw = QtWidgets.QLabel("MW = 0 g/mol")
@@ -89,43 +119,45 @@ class MassFractionCalculatorDialog(QtWidgets.QDialog):
 
     def recalculate(self) -> None:
         """Calculates the mass fraction of each valid element in the formula."""
-        self.ratios = {}
-        elements = db["elements"]
-        for element, number in self.searchFormula():
-            idx = np.flatnonzero(elements["Symbol"] == element)
-            if idx.size > 0:
-                ratio = elements["MW"][idx[0]] * float(number or 1.0)
-                self.ratios[element] = self.ratios.get(element, 0.0) + ratio
-        self.mw = sum(self.ratios.values())
-        for element in self.ratios:
-            self.ratios[element] = self.ratios[element] / self.mw
+        masses, self.mw = _parse_formula(self.lineedit_formula.text())
+        self.ratios = {element: mass / self.mw for element, mass in masses}
         self.ratiosChanged.emit()
 
-    def searchFormula(self) -> Generator[tuple[str, float], None, None]:
-        iter = self.regex.globalMatch(self.lineedit_formula.text())
-        while iter.hasNext():
-            match = iter.next()
-            yield match.captured(1), float(match.captured(2) or 1.0)
-
     def updateLabels(self) -> None:
-        self.textedit_ratios.setPlainText("")
         if len(self.ratios) == 0:
-            return
-        text = "<html>"
-        for i, (element, ratio) in enumerate(self.ratios.items()):
-            if i == 0:
-                text += "<b>"
-            text += f"{element:<2}&nbsp;{ratio:.4f}&nbsp;&nbsp;"
-            if i == 0:
-                text += "</b>"
-            if i % 3 == 2:
-                text += "<br>"
-        text += "</html>"
-        self.textedit_ratios.setText(text)
+            html = ""
+        else:
+            # join a list of parts, += reallocates the string each iteration
+            parts = ["<html>"]
+            for i, (element, ratio) in enumerate(self.ratios.items()):
+                parts.append(
+                    _ratio_row_format(
+                        "<b>" if i == 0 else "",
+                        element,
+                        ratio,
+                        "</b>" if i == 0 else "",
+                        "<br>" if i % 3 == 2 else "",
+                    )
+                )
+            parts.append("</html>")
+            html = "".join(parts)
+
+        # only touch the text edit when the content changes
+        if html != self._last_ratio_html:
+            self._last_ratio_html = html
+            self.textedit_ratios.setHtml(html)
 
+        if len(self.ratios) == 0:
+            return
         self.label_mw.setText(f"MW = {self.mw:.4g} g/mol")
 
 
+@cache
+def _particle_db() -> np.ndarray:
+    # concatenated on first use, the database dialog only reads from it
+    return np.concatenate((db["inorganic"], db["polymer"]))
+
+
 class ParticleDatabaseDialog(QtWidgets.QDialog):
     densitySelected = QtCore.Signal(float)
     formulaSelected = QtCore.Signal(str)
@@ -144,8 +176,7 @@ class ParticleDatabaseDialog(QtWidgets.QDialog):
         self.button_box.rejected.connect(self.reject)
 
         self.model = NumpyRecArrayTableModel(
-            np.concatenate((db["inorganic"], db["polymer"])),
-            name_formats={"Density": "{:.4g}"},
+            _particle_db(), name_formats={"Density": "{:.4g}"}
         )
         self.proxy = SearchColumnsProxyModel([0, 1])
         self.proxy.setSourceModel(self.model)
@@ -158,20 +189,29 @@ class ParticleDatabaseDialog(QtWidgets.QDialog):
             QtWidgets.QAbstractScrollArea.AdjustToContentsOnFirstShow
         )
         self.table.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        # interactive sizing, Stretch recomputes every section on a refilter
         self.table.horizontalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.Stretch
+            QtWidgets.QHeaderView.Interactive
         )
+        self.table.horizontalHeader().setDefaultSectionSize(196)
+        self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.table.setModel(self.proxy)
-        self.table.setColumnHidden(4, True)
+        # fixed row heights, per row size hints are recomputed on a refilter
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.table.setVerticalScrollMode(
+            QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
 
-        self.lineedit_search.textChanged.connect(self.searchDatabase)
-        self.lineedit_search.textChanged.connect(self.table.clearSelection)
+        # debounce so rapid typing only filters the database once
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.searchDatabase)
+        self.lineedit_search.textChanged.connect(self.search_timer.start)
         self.table.pressed.connect(self.completeChanged)
         self.table.doubleClicked.connect(self.accept)
-        self.proxy.rowsInserted.connect(self.completeChanged)
-        self.proxy.rowsRemoved.connect(self.completeChanged)
 
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(QtWidgets.QLabel("Search"), 0)
@@ -182,18 +222,22 @@ class ParticleDatabaseDialog(QtWidgets.QDialog):
         self.setLayout(layout)
         self.completeChanged()
 
-    def searchDatabase(self, string: str) -> None:
-        self.proxy.setSearchString(string)
+    def searchDatabase(self) -> None:
+        # a refilter emits per row insert / remove signals, update once after
+        self.proxy.setSearchString(self.lineedit_search.text())
+        self.table.clearSelection()
+        self.completeChanged()
 
     def isComplete(self) -> bool:
-        return len(self.table.selectedIndexes()) > 0
+        # hasSelection avoids building a list of every selected index
+        return self.table.selectionModel().hasSelection()
 
     def completeChanged(self) -> None:
         complete = self.isComplete()
         self.button_box.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(complete)
 
     def accept(self) -> None:
-        idx = self.table.selectedIndexes()
-        self.densitySelected.emit(float(self.proxy.data(idx[3])))
-        self.formulaSelected.emit(self.proxy.data(idx[0]))
+        idx = self.table.selectionModel().selectedRows()[0]
+        self.densitySelected.emit(float(self.proxy.data(idx.siblingAtColumn(3))))
+        self.formulaSelected.emit(self.proxy.data(idx))
         super().accept()
@@ -71,6 +71,7 @@ def draw_histogram_view(
     colors: list[QtGui.QColor] | None = None,
     show_fit: bool = True,
     show_limits: bool = True,
+    fit_in_thread: bool = False,
 ) -> HistogramView | None:
 
     # defaults
@@ -105,8 +106,10 @@ def draw_histogram_view(
     label, unit, modifier = mode_label
 
     names = tuple(results.keys())
+    # float32 is more than display precision and halves the memory traffic
+    # of the histogram / percentile passes below
     graph_data = {
-        k: np.maximum(0.0, v.calibrated(key, use_indicies=False))
+        k: np.maximum(v.calibrated(key, use_indicies=False), 0.0, dtype=np.float32)
         for k, v in results.items()
         if (k in names and v.canCalibrate(key))
     }
@@ -123,24 +126,33 @@ def draw_histogram_view(
     if len(graph_data) == 0:
         return None
 
-    # median FD bin width
+    # data at filtered indicies and min / percentile, reused for binning and draw
+    # min is computed as the 0th percentile, a single partition for both bounds
+    idx_data = {k: v[graph_idx[k]] for k, v in graph_data.items()}
+    idx_bounds = {
+        k: np.percentile(v, [0.0, options["percentile"]]) for k, v in idx_data.items()
+    }
+
+    # median FD bin width, estimate the IQR from a strided subsample for
+    # very large data, the width is a heuristic and does not need every event
     if bin_width is None:
+        max_fd_size = 500_000
+        fd_data = {
+            k: v if v.size <= max_fd_size else v[:: v.size // max_fd_size]
+            for k, v in idx_data.items()
+        }
         bin_width = np.median(
             [
                 2.0
-                * np.subtract(
-                    *np.percentile(graph_data[name][graph_idx[name]], [75, 25])
-                )
-                / np.cbrt(graph_idx[name].size)
+                * np.subtract(*np.percentile(fd_data[name], [75, 25]))
+                / np.cbrt(idx_data[name].size)
                 for name in graph_data
             ]
         )
     # Limit maximum / minimum number of bins
     data_range = 0.0
-    for name, data in graph_data.items():
-        ptp = np.percentile(data[graph_idx[name]], options["percentile"]) - np.amin(
-            data[graph_idx[name]]
-        )
+    for name in graph_data:
+        ptp = idx_bounds[name][1] - idx_bounds[name][0]
         if ptp > data_range:
             data_range = ptp
 
@@ -154,13 +166,10 @@ def draw_histogram_view(
     elif bin_width > data_range / min_bins:
         logger.warning(f"drawGraphHist: less than minimum bins, setting to {min_bins}")
         bin_width = data_range / min_bins
-    bin_width *= modifier  # convert to base unit (kg -> g)
 
     for i, (name, data) in enumerate(graph_data.items()):
-        max_bin = np.percentile(data[graph_idx[name]], options["percentile"])
-        bins = np.arange(
-            data.min() * modifier, max_bin * modifier + bin_width, bin_width
-        )
+        min_bin, max_bin = idx_bounds[name]
+        bins = np.arange(min_bin, max_bin + bin_width, bin_width)
         if bins.size == 1:
             bins = np.array([bins[0], max_bin])
         bins -= bins[0] % bin_width  # align bins
@@ -177,7 +186,7 @@ def draw_histogram_view(
 
         non_zero = np.flatnonzero(data)
 
-        limits = {"mean": np.mean(data[graph_idx[name]]) * modifier}
+        limits = {"mean": np.mean(idx_data[name]) * modifier}
         if isinstance(lod, np.ndarray):
             limits["LOD (mean)"] = np.nanmean(lod) * modifier
         else:
@@ -191,12 +200,12 @@ def draw_histogram_view(
         pen.setCosmetic(True)
 
         graph.draw(
-            data[graph_idx[name]] * modifier,
-            filtered_data=data[np.setdiff1d(non_zero, filter_idx, assume_unique=True)]
-            * modifier,
+            idx_data[name],
+            filtered_data=data[np.setdiff1d(non_zero, filter_idx, assume_unique=True)],
             bins=bins,
             bar_width=width,
             bar_offset=offset,
+            data_scale=modifier,  # convert to base unit (kg -> g)
             pen=pen,
             brush=QtGui.QBrush(colors[i]),
             name=name,
@@ -205,5 +214,6 @@ def draw_histogram_view(
             draw_limits=limits,
             limits_visible=show_limits,
             draw_filtered=options["draw filtered"],
+            fit_in_thread=fit_in_thread,
         )
     return graph
@@ -6,6 +6,58 @@ from spcal.fit import fit_lognormal, fit_normal, lognormal_pdf, normal_pdf
 from spcal.gui.graphs.base import SinglePlotGraphicsView
 from spcal.gui.graphs.legends import HistogramItemSample
 from spcal.gui.graphs.viewbox import ViewBoxForceScaleAtZero
+from spcal.gui.util import Worker
+
+
+def _histogram(
+    data: np.ndarray, bins: str | np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Histogram that uses numpy's uniform bin fast path where possible.
+
+    ``np.histogram`` only uses fast (linear) bin indexing when passed a number
+    of bins, explicit edges go through a per event ``searchsorted``. Edges
+    passed to draws are uniform so convert them to a count and range.
+    """
+    if isinstance(bins, np.ndarray) and bins.size > 1:
+        widths = np.diff(bins)
+        if np.allclose(widths, widths[0]):
+            hist, _ = np.histogram(data, bins.size - 1, range=(bins[0], bins[-1]))
+            return hist, bins
+    return np.histogram(data, bins)
+
+
+def _fit_histogram(
+    hist: np.ndarray, edges: np.ndarray, size: int, fit_type: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fit a distribution to histogram data, returns the fitted curve."""
+    centers = (edges[:-1] + edges[1:]) / 2.0
+    bin_width = edges[1] - edges[0]
+    # scale for density
+    hist = hist * (1.0 / (bin_width * size))
+    xs = np.linspace(centers[0] - bin_width, centers[-1] + bin_width, 1024)
+    if fit_type == "normal":
+        fit = fit_normal(centers, hist)
+        ys = normal_pdf(xs * fit[2], fit[0], fit[1])
+    elif fit_type == "log normal":
+        fit = fit_lognormal(centers, hist)
+        ys = lognormal_pdf(xs + fit[2], fit[0], fit[1])
+    else:
+        raise ValueError(f"_fit_histogram: unknown fit {fit_type}")
+
+    # rescale
+    ys = ys * bin_width * size
+    return xs, np.nan_to_num(ys)
+
+
+def _fit_task(
+    generation: int,
+    name: str | None,
+    hist: np.ndarray,
+    edges: np.ndarray,
+    size: int,
+    fit_type: str,
+) -> tuple:
+    return generation, name, *_fit_histogram(hist, edges, size, fit_type)
 
 
 class HistogramView(SinglePlotGraphicsView):
@@ -23,6 +75,15 @@ class HistogramView(SinglePlotGraphicsView):
         self.has_image_export = True
         self.plot.setLimits(xMin=0.0, yMin=0.0)
 
+        # for discarding stale threaded fit results
+        self._fit_generation = 0
+        self._pending_fits: dict[str | None, tuple] = {}
+
+    def clear(self) -> None:
+        self._fit_generation += 1
+        self._pending_fits.clear()
+        super().clear()
+
     def draw(
         self,
         data: np.ndarray,
@@ -30,6 +91,7 @@ class HistogramView(SinglePlotGraphicsView):
         bins: str | np.ndarray = "auto",
         bar_width: float = 0.5,
         bar_offset: float = 0.0,
+        data_scale: float = 1.0,
         name: str | None = None,
         pen: QtGui.QPen | None = None,
         brush: QtGui.QBrush | None = None,
@@ -38,6 +100,7 @@ class HistogramView(SinglePlotGraphicsView):
         fit_visible: bool = True,
         limits_visible: bool = True,
         draw_filtered: bool = False,
+        fit_in_thread: bool = False,
     ) -> None:
         if pen is None:
             pen = QtGui.QPen(QtCore.Qt.GlobalColor.black)
@@ -47,7 +110,11 @@ class HistogramView(SinglePlotGraphicsView):
 
         fm = QtGui.QFontMetrics(self.font)
 
-        hist, edges = np.histogram(data, bins)
+        # bin counts are invariant to scaling, so histogram unscaled data and
+        # convert only the edges, avoiding a full size temporary per draw
+        hist, edges = _histogram(data, bins)
+        if data_scale != 1.0:
+            edges = edges * data_scale
         curve = self.drawData(
             hist,
             edges,
@@ -57,7 +124,9 @@ class HistogramView(SinglePlotGraphicsView):
             brush=brush,
         )
         if draw_filtered:
-            hist_filt, edges_filt = np.histogram(filtered_data, bins)
+            hist_filt, edges_filt = _histogram(filtered_data, bins)
+            if data_scale != 1.0:
+                edges_filt = edges_filt * data_scale
             curve_filt = self.drawData(
                 hist_filt,
                 edges_filt,
@@ -73,15 +142,30 @@ class HistogramView(SinglePlotGraphicsView):
         if draw_fit is not None:
             fit_pen = QtGui.QPen(brush.color().darker(), 2.0 * pen.widthF())
             fit_pen.setCosmetic(True)
-            curve = self.drawFit(
-                hist,
-                edges,
-                data.size,
-                fit_type=draw_fit,
-                pen=fit_pen,
-                visible=fit_visible,
-            )
-            legend.setFit(curve)
+            if fit_in_thread:
+                # compute the fit off the GUI thread, added when ready
+                self._pending_fits[name] = (legend, fit_pen, fit_visible)
+                worker = Worker(
+                    _fit_task,
+                    self._fit_generation,
+                    name,
+                    hist,
+                    edges,
+                    data.size,
+                    draw_fit,
+                )
+                worker.signals.result.connect(self.addThreadedFit)
+                QtCore.QThreadPool.globalInstance().start(worker)
+            else:
+                curve = self.drawFit(
+                    hist,
+                    edges,
+                    data.size,
+                    fit_type=draw_fit,
+                    pen=fit_pen,
+                    visible=fit_visible,
+                )
+                legend.setFit(curve)
 
         if draw_limits is not None:
             lim_pen = QtGui.QPen(brush.color().darker(), 2.0 * pen.widthF())
@@ -151,30 +235,24 @@ class HistogramView(SinglePlotGraphicsView):
         fit_type: str = "log normal",
         visible: bool = True,
         pen: QtGui.QPen | None = None,
+    ) -> pyqtgraph.PlotCurveItem:
+        xs, ys = _fit_histogram(hist, edges, size, fit_type)
+        return self.drawFitCurve(xs, ys, visible=visible, pen=pen)
+
+    def drawFitCurve(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        visible: bool = True,
+        pen: QtGui.QPen | None = None,
     ) -> pyqtgraph.PlotCurveItem:
         if pen is None:
             pen = QtGui.QPen(QtCore.Qt.black, 1.0)
             pen.setCosmetic(True)
 
-        centers = (edges[:-1] + edges[1:]) / 2.0
-        bin_width = edges[1] - edges[0]
-        # scale for density
-        hist = hist / bin_width / size
-        xs = np.linspace(centers[0] - bin_width, centers[-1] + bin_width, 1024)
-        if fit_type == "normal":
-            fit = fit_normal(centers, hist)
-            ys = normal_pdf(xs * fit[2], fit[0], fit[1])
-        elif fit_type == "log normal":
-            fit = fit_lognormal(centers, hist)
-            ys = lognormal_pdf(xs + fit[2], fit[0], fit[1])
-        else:
-            raise ValueError(f"drawFit: unknown fit {fit_type}")
-
-        # rescale
-        ys = ys * bin_width * size
         curve = pyqtgraph.PlotCurveItem(
             x=xs,
-            y=np.nan_to_num(ys),
+            y=ys,
             pen=pen,
             connect="all",
             skipFiniteCheck=True,
@@ -184,6 +262,14 @@ class HistogramView(SinglePlotGraphicsView):
         self.plot.addItem(curve)
         return curve
 
+    def addThreadedFit(self, result: tuple) -> None:
+        generation, name, xs, ys = result
+        if generation != self._fit_generation or name not in self._pending_fits:
+            return  # cleared or redrawn since the fit was started
+        legend, pen, visible = self._pending_fits.pop(name)
+        curve = self.drawFitCurve(xs, ys, visible=visible, pen=pen)
+        legend.setFit(curve)
+
     def drawLimit(
         self,
         limit: float,
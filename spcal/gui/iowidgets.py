@@ -1,6 +1,7 @@
 import logging
 from typing import Iterator, Type
 
+import bottleneck as bn
 import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -487,7 +488,7 @@ class ResultIOWidget(IOWidget):
             return
 
         mean = np.mean(values)
-        median = np.median(values)
+        median = bn.median(values)
         std = np.std(values)
 
         mean_lod = np.mean(lod)
@@ -596,6 +597,8 @@ class IOStack(QtWidgets.QWidget):
         raise NotImplementedError
 
     def repopulate(self, names: list[str]) -> None:
+        if names == self.names():  # no change, avoid rebuilding the stack
+            return
         self.blockSignals(True)
         old_widgets = {
             name: widget for name, widget in zip(self.names(), self.widgets())
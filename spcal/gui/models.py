@@ -176,20 +176,79 @@ class SearchColumnsProxyModel(QtCore.QSortFilterProxyModel):
     def __init__(self, columns: list[int], parent: QtCore.QObject | None = None):
         super().__init__(parent)
         self._search_string = ""
+        self._search_tokens: list[str] = []
+        self._accepted_rows: set[int] = set()
+        self._candidate_rows: set[int] | None = None
+        self._mask: np.ndarray | None = None
+        self._lowered_columns: dict[str, np.ndarray] = {}
         self.columns = columns
 
+    def setSourceModel(self, model: QtCore.QAbstractItemModel) -> None:
+        super().setSourceModel(model)
+        self._mask = None
+        self._lowered_columns = {}
+
     def setSearchString(self, string: str) -> None:
+        if string == self._search_string:  # no refilter, all rows unchanged
+            return
+        # rows matching an extended search are a subset of the current matches
+        extended = self._search_string != "" and string.startswith(
+            self._search_string
+        )
+        self.beginFilterChange()
         self._search_string = string
-        self.invalidateFilter()
+        # lower and split once here instead of in every filterAcceptsRow
+        self._search_tokens = string.lower().split(" ")
+        self._mask = self.searchMask()
+        self._candidate_rows = (
+            self._accepted_rows if extended and self._mask is None else None
+        )
+        self._accepted_rows = set()
+        # only rows are filtered, skips re-checking columns and sort order
+        self.endFilterChange(QtCore.QSortFilterProxyModel.Direction.Rows)
+
+    def searchMask(self) -> np.ndarray | None:
+        """Match every row of a numpy array source model in one pass.
+
+        Returns None when the source does not store a structured array of
+        strings, in which case rows are matched via ``data``.
+        """
+        if self._search_string == "":
+            return None
+        array = getattr(self.sourceModel(), "array", None)
+        if array is None or array.dtype.names is None:
+            return None
+        try:
+            names = [array.dtype.names[column] for column in self.columns]
+        except IndexError:
+            return None
+        if any(array.dtype[name].kind != "U" for name in names):
+            return None
+
+        mask = np.zeros(array.size, dtype=bool)
+        for name in names:
+            if name not in self._lowered_columns:
+                self._lowered_columns[name] = np.char.lower(array[name])
+            lowered = self._lowered_columns[name]
+            column_mask = np.ones(array.size, dtype=bool)
+            for token in self._search_tokens:
+                column_mask &= np.char.find(lowered, token) >= 0
+            mask |= column_mask
+        return mask
 
     def filterAcceptsRow(
         self, source_row: int, source_parent: QtCore.QModelIndex
     ) -> bool:
         if self._search_string == "":
             return True
-        tokens = self._search_string.lower().split(" ")
+        if self._mask is not None:
+            return bool(self._mask[source_row])
+        if self._candidate_rows is not None and source_row not in self._candidate_rows:
+            return False
+        source = self.sourceModel()
         for column in self.columns:
-            idx = self.sourceModel().index(source_row, column, source_parent)
-            if all(x in self.sourceModel().data(idx).lower() for x in tokens):
+            idx = source.index(source_row, column, source_parent)
+            if all(x in source.data(idx).lower() for x in self._search_tokens):
+                self._accepted_rows.add(source_row)
                 return True
         return False
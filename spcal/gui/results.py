@@ -171,6 +171,19 @@ class ResultsWidget(QtWidgets.QWidget):
         self.graph_stack.addWidget(self.scatter_widget)
         self.graph_stack.addWidget(self.pca_widget)
 
+        self.graph_widget_names = {
+            self.graph_hist: "histogram",
+            self.graph_composition: "composition",
+            self.scatter_widget: "scatter",
+            self.pca_widget: "pca",
+        }
+        self.graph_draw_functions = {
+            "histogram": self.drawGraphHist,
+            "composition": self.drawGraphCompositions,
+            "scatter": self.drawGraphScatter,
+            "pca": self.drawGraphPCA,
+        }
+
         self.io = ResultIOStack()
         self.io.nameChanged.connect(self.updateGraphsForName)
 
@@ -194,10 +207,13 @@ class ResultsWidget(QtWidgets.QWidget):
             QtCore.Qt.ToolTipRole,
         )
         self.mode.setCurrentText("Signal")
-        self.mode.currentIndexChanged.connect(self.updateOutputs)
-        self.mode.currentIndexChanged.connect(self.updateScatterElements)
-        self.mode.currentIndexChanged.connect(self.updatePCAElements)
-        self.mode.currentIndexChanged.connect(self.redraw)
+        # debounce rapid mode changes into a single update
+        self.mode_timer = QtCore.QTimer(self)
+        self.mode_timer.setSingleShot(True)
+        self.mode_timer.setInterval(50)
+        self.mode_timer.timeout.connect(self.onModeChanged)
+        # lambda so the index is not taken as a new interval by start(int)
+        self.mode.currentIndexChanged.connect(lambda: self.mode_timer.start())
 
         self.label_file = QtWidgets.QLabel()
 
@@ -538,31 +554,23 @@ class ResultsWidget(QtWidgets.QWidget):
         dlg.open()
 
     # Plotting
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        self.drawIfRequired()  # flush any draw skipped while hidden
+
     def drawIfRequired(self, graph: str | None = None) -> None:
+        if not self.isVisible():  # defer drawing until shown
+            return
         if graph is None:
             w = self.graph_stack.widget(self.graph_stack.currentIndex())
-            if w == self.graph_hist:
-                graph = "histogram"
-            elif w == self.graph_composition:
-                graph = "composition"
-            elif w == self.scatter_widget:
-                graph = "scatter"
-            elif w == self.pca_widget:
-                graph = "pca"
-            else:
-                raise ValueError(f"unkown graph widget '{graph}'")
+            if w not in self.graph_widget_names:
+                raise ValueError(f"unkown graph widget '{w}'")
+            graph = self.graph_widget_names[w]
 
         if self.redraw_required[graph]:
-            if graph == "histogram":
-                self.drawGraphHist()
-            elif graph == "composition":
-                self.drawGraphCompositions()
-            elif graph == "scatter":
-                self.drawGraphScatter()
-            elif graph == "pca":
-                self.drawGraphPCA()
-            else:
-                ValueError(f"unkown graph type '{graph}'")
+            if graph not in self.graph_draw_functions:
+                raise ValueError(f"unkown graph type '{graph}'")
+            self.graph_draw_functions[graph]()
             self.redraw_required[graph] = False
 
     def redraw(self) -> None:
@@ -589,6 +597,7 @@ class ResultsWidget(QtWidgets.QWidget):
             colors=colors,
             show_fit=is_single,
             show_limits=is_single,
+            fit_in_thread=True,  # keep the GUI responsive during fits
         )
         self.graph_hist.setDataLimits(xMax=1.0)
         self.graph_hist.zoomReset()
@@ -829,6 +838,12 @@ class ResultsWidget(QtWidgets.QWidget):
             self.combo_pca_colour.setCurrentIndex(0)
         self.combo_pca_colour.blockSignals(False)
 
+    def onModeChanged(self) -> None:
+        self.updateOutputs()
+        self.updateScatterElements()
+        self.updatePCAElements()
+        self.redraw()
+
     def updateOutputs(self) -> None:
         mode = self.mode.currentText()
         key = self.mode_keys[mode]
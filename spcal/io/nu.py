@@ -175,7 +175,12 @@ def get_signals_from_nu_data(integs: list[np.ndarray], num_acc: int) -> np.ndarr
         dtype=np.float32,
     )
     for integ in integs:
-        signals[(integ["acq_number"] // num_acc) - 1] = integ["result"]["signal"]
+        rows = (integ["acq_number"] // num_acc) - 1
+        if rows.size > 0 and rows[-1] - rows[0] + 1 == rows.size:
+            # contiguous acquisitions, a slice write avoids the row gather
+            signals[rows[0] : rows[-1] + 1] = integ["result"]["signal"]
+        else:  # pragma: no cover, missing acquisitions
+            signals[rows] = integ["result"]["signal"]
 
     return signals
 
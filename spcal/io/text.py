@@ -7,6 +7,7 @@ import logging
 from pathlib import Path
 from typing import Any, Callable, Set, TextIO
 
+import bottleneck as bn
 import numpy as np
 
 from spcal.result import SPCalResult
@@ -66,7 +67,7 @@ def read_single_particle_file(
         else None
 
     Returns:
-        data, structred array
+        data, structured array
     """
 
     def csv_read_lines(fp, delimiter: str = ",", count: int = 0):
@@ -78,7 +79,9 @@ def read_single_particle_file(
 
     path = Path(path)
     with path.open("r") as fp:
-        gen = csv_read_lines(fp, delimiter)
+        # no decimal commas possible with a comma delimiter, loadtxt can then
+        # use its own reader without a Python generator in the loop
+        gen = fp if delimiter == "," else csv_read_lines(fp, delimiter)
         for i in range(first_line - 1):
             next(gen)
 
@@ -207,7 +210,7 @@ def append_results_summary(
             f"{file},Ionic background,{unit}/L,",
         )
 
-        for label, ufunc in zip(["Mean", "Median"], [np.mean, np.median]):
+        for label, ufunc in zip(["Mean", "Median"], [np.mean, bn.median]):
             for key in SPCalResult.base_units.keys():
                 unit, factor = result_units[key]
                 _write_if_exists(
@@ -394,7 +397,7 @@ def export_single_particle_results(
         )
         fp.write("#\n")
 
-        for label, ufunc in zip(["Mean", "Median"], [np.mean, np.median]):
+        for label, ufunc in zip(["Mean", "Median"], [np.mean, bn.median]):
             fp.write(f"# {label},{','.join(results.keys())}\n")
             for key in SPCalResult.base_units.keys():
                 unit, factor = result_units[key]
@@ -503,8 +506,8 @@ def export_single_particle_results(
         # Non-filtered indicies
         valid = SPCalResult.all_valid_indicies(list(results.values()))
 
-        # Output data
-        data = [] if detection_times is None else [detection_times[valid]]
+        # Collect columns then fill a pre-allocated array, avoiding stack copies
+        columns = []
         header_name = "" if detection_times is None else ",Time"
         header_unit = "" if detection_times is None else ",s"
 
@@ -514,43 +517,54 @@ def export_single_particle_results(
                     unit, factor = result_units[key]
                     header_name += f",{name}"
                     header_unit += f",{unit}"
-                    data.append(
-                        result.calibrated(key, use_indicies=False)[valid] / factor
-                    )
+                    columns.append((result, key, factor))
 
-        data = np.stack(data, axis=1)
+        offset = 0 if detection_times is None else 1
+        num_columns = offset + len(columns)
+        if export_clusters:
+            num_columns += len(clusters)
+
+        data = np.empty((valid.size, num_columns), dtype=np.float64)
+        if detection_times is not None:
+            data[:, 0] = detection_times[valid]
+        for i, (result, key, factor) in enumerate(columns, offset):
+            np.divide(
+                result.calibrated(key, use_indicies=False)[valid],
+                factor,
+                out=data[:, i],
+            )
 
         if export_clusters:
-            idx = np.zeros(valid.size)
             for key in SPCalResult.base_units.keys():
                 if key in clusters:
                     header_name += ",cluster idx"
                     header_unit += f",{key}"
 
-            indicies = []
-            for cluster in clusters.values():
-                idx = np.zeros(valid.size, dtype=int)
-                idx[valid] = cluster + 1
-                indicies.append(idx)
-
-            indicies = np.stack(indicies, axis=1)
-            data = np.concatenate((data, indicies), axis=1)
+            for i, cluster in enumerate(clusters.values(), offset + len(columns)):
+                data[:, i] = 0.0
+                data[valid, i] = cluster + 1
 
         fp.write(header_name[1:] + "\n")
         fp.write(header_unit[1:] + "\n")
+        # batch formatted rows to amortise the per write dispatch
+        lines: list[str] = []
         for line in data:
             if np.all(
                 line == 0.0
             ):  # pragma: no cover, don't write line if all filtered
                 continue
-            fp.write(
+            lines.append(
                 ",".join("" if x == 0.0 else "{:.8g}".format(x) for x in line) + "\n"
             )
+            if len(lines) == 4096:
+                fp.write("".join(lines))
+                lines.clear()
+        fp.write("".join(lines))
         fp.write("#\n")
 
     path = Path(path)
 
-    with path.open("w", encoding="utf-8") as fp:
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as fp:
         write_header(fp, next(iter(results.values())))
         if output_inputs:
             write_inputs(fp, results)
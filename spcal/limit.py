@@ -247,12 +247,16 @@ class SPCalLimit(object):
         ) or iters == 0:
             prev_threshold = threshold
 
+            # nothing is above the initial infinite threshold, skip filtering
             if window_size == 0:  # No window
-                lam = bn.nanmean(responses[responses < threshold])
+                below = responses if iters == 0 else responses[responses < threshold]
+                lam = bn.nanmean(below)
             else:
                 halfwin = window_size // 2
                 pad = np.pad(
-                    np.where(responses < threshold, responses, np.nan),
+                    responses
+                    if iters == 0
+                    else np.where(responses < threshold, responses, np.nan),
                     [halfwin, halfwin],
                     mode="reflect",
                 )
@@ -323,13 +327,17 @@ class SPCalLimit(object):
         ) or iters == 0:
             prev_threshold = threshold
 
+            # nothing is above the initial infinite threshold, skip filtering
             if window_size == 0:  # No window
-                mu = bn.nanmean(responses[responses < threshold])
-                std = bn.nanstd(responses[responses < threshold])
+                below = responses if iters == 0 else responses[responses < threshold]
+                mu = bn.nanmean(below)
+                std = bn.nanstd(below)
             else:
                 halfwin = window_size // 2
                 pad = np.pad(
-                    np.where(responses < threshold, responses, np.nan),
+                    responses
+                    if iters == 0
+                    else np.where(responses < threshold, responses, np.nan),
                     [halfwin, halfwin],
                     mode="reflect",
                 )
@@ -402,12 +410,16 @@ class SPCalLimit(object):
             np.all(np.abs(prev_threshold - threshold) > iter_eps) and iters < max_iters
         ) or iters == 0:
             prev_threshold = threshold
+            # nothing is above the initial infinite threshold, skip filtering
             if window_size == 0:  # No window
-                mu = bn.nanmean(responses[responses < threshold])
+                below = responses if iters == 0 else responses[responses < threshold]
+                mu = bn.nanmean(below)
             else:
                 halfwin = window_size // 2
                 pad = np.pad(
-                    np.where(responses < threshold, responses, np.nan),
+                    responses
+                    if iters == 0
+                    else np.where(responses < threshold, responses, np.nan),
                     [halfwin, halfwin],
                     mode="reflect",
                 )
@@ -2,6 +2,16 @@
 import numpy as np
 
 
+def _as_contiguous(x: float | np.ndarray) -> float | np.ndarray:
+    """Contiguous float64 input uses numpy's fast ufunc loops.
+
+    No copy is made unless required, e.g. for structured array field views.
+    """
+    if isinstance(x, np.ndarray):
+        return np.ascontiguousarray(x, dtype=np.float64)
+    return x
+
+
 def atoms_per_particle(
     masses: float | np.ndarray,
     molar_mass: float,
@@ -15,7 +25,8 @@ def atoms_per_particle(
         molar_mass: molecular weight (kg/mol)
     """
     Na = 6.02214076e23
-    return masses * Na / molar_mass
+    masses = _as_contiguous(masses)
+    return masses * (Na / molar_mass)  # fold scalars into a single pass
 
 
 def cell_concentration(
@@ -31,7 +42,11 @@ def cell_concentration(
         diameter: cell diameter (m)
         molar_mass: molecular weight (kg/mol)
     """
-    return masses / ((4.0 / 3.0 * np.pi * (diameter / 2.0) ** 3) * 1000.0 * molar_mass)
+    # multiply by the scalar reciprocal, avoiding a per-element division
+    masses = _as_contiguous(masses)
+    return masses * (
+        1.0 / ((4.0 / 3.0 * np.pi * (diameter / 2.0) ** 3) * 1000.0 * molar_mass)
+    )
 
 
 def nebulisation_efficiency_from_concentration(
@@ -100,6 +115,7 @@ def particle_mass(
         response_factor: counts / concentration (kg/L)
         mass_fraction:  molar mass analyte / molar mass particle
     """
+    signal = _as_contiguous(signal)
     return signal * (dwell * flow_rate * efficiency / (response_factor * mass_fraction))
 
 
@@ -128,7 +144,11 @@ def particle_size(masses: float | np.ndarray, density: float) -> float | np.ndar
         masses: array of particle signals (kg)
         density: reference density (kg/m3)
     """
-    return np.cbrt(6.0 / (np.pi * density) * masses)
+    coef = 6.0 / (np.pi * density)
+    if isinstance(masses, np.ndarray):  # reuse the multiply temporary
+        out = np.multiply(_as_contiguous(masses), coef)
+        return np.cbrt(out, out=out)
+    return np.cbrt(coef * masses)
 
 
 def particle_total_concentration(
@@ -80,9 +80,10 @@ def formula_a(
     z_b = NormalDist().inv_cdf((1.0 - beta))
 
     tr = t_sample / t_blank
+    Nbtr1 = Nb * (1.0 + tr)  # shared by both limits
 
-    Sc = z_a * np.sqrt(Nb * tr * (1.0 + tr))
-    Sd = Sc + z_b**2 / 2.0 + z_b * np.sqrt((z_b**2 / 4.0) + Sc + Nb * (1.0 + tr))
+    Sc = z_a * np.sqrt(Nbtr1 * tr)
+    Sd = Sc + z_b**2 / 2.0 + z_b * np.sqrt((z_b**2 / 4.0) + Sc + Nbtr1)
 
     return Sc, Sd
 
@@ -130,11 +131,10 @@ def formula_c(
     z_b = NormalDist().inv_cdf((1.0 - beta))
 
     tr = t_sample / t_blank
+    Nbtr1 = Nb * (1.0 + tr)  # shared by both limits
 
-    Sc = z_a**2 / 2.0 * tr + z_a * np.sqrt(
-        z_a**2 / 4.0 * tr * tr + Nb * tr * (1.0 + tr)
-    )
-    Sd = Sc + z_b**2 / 2.0 + z_b * np.sqrt((z_b**2 / 4.0) + Sc + Nb * (1.0 + tr))
+    Sc = z_a**2 / 2.0 * tr + z_a * np.sqrt(z_a**2 / 4.0 * tr * tr + Nbtr1 * tr)
+    Sd = Sc + z_b**2 / 2.0 + z_b * np.sqrt((z_b**2 / 4.0) + Sc + Nbtr1)
 
     return Sc, Sd
 
@@ -170,15 +170,9 @@ def stapleton_approximation(
 
     d = z_a / 4.112
     tr = t_sample / t_blank
-    rb = Nb / t_blank
+    trtr1 = tr * (1.0 + tr)  # shared by both limits, Nb / t_blank * t_sample == Nb * tr
 
-    Sc = (
-        d * (tr - 1.0)
-        + z_a**2 / 4.0 * (1.0 + tr)
-        + z_a * np.sqrt((Nb + d) * tr * (1.0 + tr))
-    )
-    Sd = (z_a + z_b) ** 2 / 4.0 * (1.0 + tr) + (z_a + z_b) * np.sqrt(
-        rb * t_sample * (1.0 + tr)
-    )
+    Sc = d * (tr - 1.0) + z_a**2 / 4.0 * (1.0 + tr) + z_a * np.sqrt((Nb + d) * trtr1)
+    Sd = (z_a + z_b) ** 2 / 4.0 * (1.0 + tr) + (z_a + z_b) * np.sqrt(Nb * trtr1)
 
     return Sc, Sd
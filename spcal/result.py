@@ -163,6 +163,7 @@ class SPCalResult(object):
         self._indicies = np.flatnonzero(detections > 0)  # checks for nan
 
         self._cache: dict[str, np.ndarray] = {}
+        self._cache_indexed: dict[str, np.ndarray] = {}
 
         self.background = np.nanmean(responses[labels == 0])
         self.background_error = np.nanstd(responses[labels == 0])
@@ -292,7 +293,8 @@ class SPCalResult(object):
                 mass_fraction=self.inputs["mass_fraction"],
             )
         else:
-            return value * self.inputs["mass_response"] / self.inputs["mass_fraction"]
+            # fold scalars so arrays are only traversed once
+            return value * (self.inputs["mass_response"] / self.inputs["mass_fraction"])
 
     def asSize(self, value: float | np.ndarray) -> float | np.ndarray:
         """Convert value to size in m.
@@ -320,7 +322,9 @@ class SPCalResult(object):
         Returns:
             value
         """
-        return self.asMass(value) * self.inputs["density"]
+        masses = self.asMass(value)
+        masses *= self.inputs["density"]  # in-place, ``asMass`` returns a new array
+        return masses
 
     def calibrated(self, key: str, use_indicies: bool = True) -> np.ndarray:
         """Return calibrated detections.
@@ -337,7 +341,9 @@ class SPCalResult(object):
         if key not in self._cache:
             self._cache[key] = np.asanyarray(self.convertTo(self.detections, key))
         if use_indicies:
-            return self._cache[key][self.indicies]
+            if key not in self._cache_indexed:
+                self._cache_indexed[key] = self._cache[key][self.indicies]
+            return self._cache_indexed[key]
         else:
             return self._cache[key]
 
@@ -245,6 +245,142 @@ py::array_t<int> cluster_by_distance(py::array_t<int> Z, py::array_t<double> ZD,
   return T;
 }
 
+py::array_t<py::ssize_t> contiguous_regions(py::array_t<double> x,
+                                            py::array_t<double> limit) {
+  if (x.ndim() != 1 || limit.ndim() != 1)
+    throw std::runtime_error("x and limit must have 1 dim");
+
+  auto v = x.unchecked<1>();
+  auto lim = limit.unchecked<1>();
+
+  py::ssize_t n = v.shape(0);
+  if (lim.shape(0) != 1 && lim.shape(0) != n)
+    throw std::runtime_error("limit must have size 1 or x.size");
+  // stride of 0 broadcasts single valued limits
+  py::ssize_t ls = lim.shape(0) == 1 ? 0 : 1;
+
+  std::vector<py::ssize_t> starts, ends;
+  bool in_region = false;
+  for (py::ssize_t i = 0; i < n; ++i) {
+    if (v[i] > lim[i * ls]) {
+      if (!in_region) {
+        in_region = true;
+        starts.push_back(i);
+      }
+    } else if (in_region) {
+      in_region = false;
+      ends.push_back(i);
+    }
+  }
+  if (in_region)
+    ends.push_back(n);
+
+  py::ssize_t k = static_cast<py::ssize_t>(starts.size());
+  auto regions = py::array_t<py::ssize_t>({k, static_cast<py::ssize_t>(2)});
+  auto r = regions.mutable_unchecked<2>();
+  for (py::ssize_t j = 0; j < k; ++j) {
+    r(j, 0) = starts[j];
+    r(j, 1) = ends[j];
+  }
+  return regions;
+}
+
+py::array_t<py::ssize_t> label_regions(py::array_t<py::ssize_t> regions,
+                                       py::ssize_t size) {
+  if (regions.ndim() != 2 || regions.shape(1) != 2)
+    throw std::runtime_error("regions must have shape (n, 2)");
+
+  auto labels = py::array_t<py::ssize_t>(size);
+  std::fill(labels.mutable_data(), labels.mutable_data() + size, 0);
+
+  auto r = regions.unchecked<2>();
+  auto l = labels.mutable_unchecked<1>();
+
+  for (py::ssize_t k = 0; k < r.shape(0); ++k) {
+    py::ssize_t end = std::min(r(k, 1), size);
+    for (py::ssize_t i = r(k, 0); i < end; ++i)
+      l[i] = k + 1;
+  }
+  return labels;
+}
+
+py::tuple accumulate_detections(py::array_t<double> y,
+                                py::array_t<double> limit_accumulation,
+                                py::array_t<double> limit_detection,
+                                py::ssize_t points_required, bool integrate) {
+  if (y.ndim() != 1)
+    throw std::runtime_error("y must have 1 dim");
+  if (limit_accumulation.ndim() != 1 || limit_detection.ndim() != 1)
+    throw std::runtime_error("limits must have 1 dim");
+
+  auto v = y.unchecked<1>();
+  auto la = limit_accumulation.unchecked<1>();
+  auto ld = limit_detection.unchecked<1>();
+
+  py::ssize_t n = v.shape(0);
+  if ((la.shape(0) != 1 && la.shape(0) != n) ||
+      (ld.shape(0) != 1 && ld.shape(0) != n))
+    throw std::runtime_error("limits must have size 1 or y.size");
+  // stride of 0 broadcasts single valued limits
+  py::ssize_t as = la.shape(0) == 1 ? 0 : 1;
+  py::ssize_t ds = ld.shape(0) == 1 ? 0 : 1;
+
+  std::vector<double> sums;
+  std::vector<py::ssize_t> starts, ends;
+
+  bool in_region = false;
+  double sum = 0.0;
+  py::ssize_t start = 0, above = 0;
+  for (py::ssize_t i = 0; i < n; ++i) {
+    double acc = la[i * as];
+    if (acc > ld[i * ds])
+      throw py::value_error(
+          "accumulate_detections: limit_accumulation > limit_detection.");
+    if (v[i] > acc) {
+      if (!in_region) {
+        in_region = true;
+        start = i;
+        sum = 0.0;
+        above = 0;
+      }
+      sum += integrate ? v[i] - acc : v[i];
+      if (v[i] > ld[i * ds])
+        above += 1;
+    } else if (in_region) {
+      in_region = false;
+      if (above >= points_required) {
+        sums.push_back(sum);
+        starts.push_back(start);
+        ends.push_back(i);
+      }
+    }
+  }
+  if (in_region && above >= points_required) {
+    sums.push_back(sum);
+    starts.push_back(start);
+    ends.push_back(n);
+  }
+
+  py::ssize_t k = static_cast<py::ssize_t>(sums.size());
+  auto sums_out = py::array_t<double>(k);
+  auto regions = py::array_t<py::ssize_t>({k, static_cast<py::ssize_t>(2)});
+  auto labels = py::array_t<py::ssize_t>(n);
+
+  auto s = sums_out.mutable_unchecked<1>();
+  auto r = regions.mutable_unchecked<2>();
+  auto l = labels.mutable_unchecked<1>();
+
+  std::fill(labels.mutable_data(), labels.mutable_data() + n, 0);
+  for (py::ssize_t j = 0; j < k; ++j) {
+    s[j] = sums[j];
+    r(j, 0) = starts[j];
+    r(j, 1) = ends[j];
+    for (py::ssize_t i = starts[j]; i < ends[j]; ++i)
+      l[i] = j + 1;
+  }
+  return py::make_tuple(sums_out, labels, regions);
+}
+
 py::array_t<int> maxima(py::array_t<double> values, py::array_t<int> regions) {
   py::buffer_info vbuf = values.request(), rbuf = regions.request();
 
@@ -298,6 +434,12 @@ PYBIND11_MODULE(spcalext, mod) {
           "Return the minimum-spanning-tree linkage.");
   mod.def("cluster_by_distance", &cluster_by_distance,
           "Cluster using MST linkage.");
+  mod.def("contiguous_regions", &contiguous_regions,
+          "Start and end (exclusive) points of regions above limit.");
+  mod.def("label_regions", &label_regions,
+          "Label regions 1 to n, zero outside of regions.");
+  mod.def("accumulate_detections", &accumulate_detections,
+          "Sum, label and locate regions above limits in a single pass.");
   mod.def("maxima", &maxima,
           "Calculates to maxima between pairs of start and end positions.");
   mod.def("poisson_quantile", &poisson_quantile,
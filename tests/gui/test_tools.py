@@ -64,8 +64,8 @@ def test_particle_database(qtbot: QtBot):
         dlg.show()
 
     dlg.lineedit_search.setText("AgCl")
-
-    assert dlg.proxy.data(dlg.proxy.index(0, 0)) == "AgCl"
+    # search is debounced
+    qtbot.wait_until(lambda: dlg.proxy.data(dlg.proxy.index(0, 0)) == "AgCl")
     assert dlg.proxy.data(dlg.proxy.index(0, 1)) == "silver (i) chloride"
     assert dlg.proxy.data(dlg.proxy.index(0, 2)) == "7783-90-6"
     assert dlg.proxy.data(dlg.proxy.index(0, 3)) == "5.56"
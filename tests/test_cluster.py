@@ -19,6 +19,11 @@ def test_agglomerative_cluster():
     assert np.allclose(stds, [[0.08165, 0.04714], [0.05, 0.05], [0.0, 0.0]])
     assert np.all(counts == [3, 2, 1])
 
+    means, stds, counts = cluster_information(a, T, max_clusters=2)
+
+    assert np.allclose(means, [[1.1, 1.466667], [0.15, 0.25]])
+    assert np.all(counts == [3, 2])
+
 
 def test_prepare_data_for_clustering():
     a = np.array(
@@ -16,3 +16,25 @@ def test_neadler_mean():
 
     assert np.isclose(args[0], 3.0)
     assert np.isclose(args[1], 4.0, atol=1e-3)
+
+
+def test_fit_normal():
+    x = np.linspace(0.1, 20.0, 100)
+    y = fit.normal_pdf(x, 10.0, 2.0)
+
+    mu, sigma, scale = fit.fit_normal(x, y)
+
+    assert np.isclose(mu, 10.0, atol=1e-2)
+    assert np.isclose(sigma, 2.0, atol=1e-2)
+    assert np.isclose(scale, 1.0, atol=1e-2)
+
+
+def test_fit_lognormal():
+    x = np.linspace(0.1, 40.0, 100)
+    y = fit.lognormal_pdf(x, 2.0, 0.4)
+
+    mu, sigma, loc = fit.fit_lognormal(x, y)
+
+    assert np.isclose(mu, 2.0, atol=1e-2)
+    assert np.isclose(sigma, 0.4, atol=1e-2)
+    assert np.isclose(loc, 0.0, atol=0.1)